@@ -1,5 +1,9 @@
-workers = 2
-threads = 2
+import multiprocessing
+
+# вебхук — чистый blocking IO (Telegram/Dify/Redis/Postgres), greenlets вместо потоков
+worker_class = "gevent"
+worker_connections = 1000
+workers = multiprocessing.cpu_count() * 2 + 1
 timeout = 120
 bind = "0.0.0.0:10000"
-# на Render порт пробрасывается через $PORT, gunicorn его подхватит из переменной окружения
\ No newline at end of file
+# на Render порт пробрасывается через $PORT, gunicorn его подхватит из переменной окружения
@@ -27,6 +27,13 @@ TEAMS = {
 }
 
 # удобный плоский словарь chat_id -> имя
-USERS = {}
-for team in TEAMS.values():
-    USERS.update(team["members"])
\ No newline at end of file
+USERS = {cid: name for team in TEAMS.values() for cid, name in team["members"].items()}
+
+# замороженные пары (chat_id, имя) по командам: считаем один раз при импорте,
+# иммутабельны — можно спокойно шарить между гринлетами
+TEAM_MEMBERS = {tid: tuple(t["members"].items()) for tid, t in TEAMS.items()}
+
+# обратные индексы под частые вопросы «это менеджер?» и «чья это команда?» —
+# O(1) вместо скана списков
+MANAGERS = frozenset(m for t in TEAMS.values() for m in t["managers"])
+CHAT_TO_TEAM = {cid: tid for tid, t in TEAMS.items() for cid in t["members"]}
\ No newline at end of file